@@ -4,16 +4,204 @@ Automated Reporting System for Continuous Deployment on Kubernetes
 Generates comprehensive test reports, coverage analysis, and trend tracking
 """
 
+import io
 import os
+import re
+import array
 import sys
-import json
 import time
-import subprocess
+import shutil
+import sqlite3
+import statistics
+import threading
+from collections import deque
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 import argparse
 
+# One row of `go tool cover -func` output: location, function, percentage.
+# The summary row has the same shape: "total:  (statements)  NN.N%".
+COVER_FUNC_RE = re.compile(rb'^(\S+)\s+(\S+)\s+(\d+\.\d+)%', re.M)
+
+# Failure markers go test prints even without -v
+FAILED_TEST_RE = re.compile(r'^\s*--- FAIL: (\S+)', re.M)
+FAILED_PACKAGE_RE = re.compile(r'^FAIL[ \t]+(\S+)', re.M)
+
+# Stylesheet for the HTML report, written next to it as report.css
+REPORT_CSS = """body {
+    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+    max-width: 1200px;
+    margin: 0 auto;
+    padding: 20px;
+    background: #f5f5f5;
+}
+.header {
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    color: white;
+    padding: 30px;
+    border-radius: 10px;
+    margin-bottom: 30px;
+}
+.summary {
+    display: grid;
+    grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+    gap: 20px;
+    margin-bottom: 30px;
+}
+.metric {
+    background: white;
+    padding: 20px;
+    border-radius: 10px;
+    box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+}
+.metric-value {
+    font-size: 2.5em;
+    font-weight: bold;
+    color: #667eea;
+}
+.metric-label {
+    color: #666;
+    margin-top: 10px;
+}
+.service {
+    background: white;
+    padding: 20px;
+    margin-bottom: 15px;
+    border-radius: 10px;
+    box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+}
+.service-header {
+    display: flex;
+    justify-content: space-between;
+    align-items: center;
+    margin-bottom: 15px;
+}
+.service-name {
+    font-size: 1.2em;
+    font-weight: bold;
+}
+.status-badge {
+    padding: 5px 15px;
+    border-radius: 20px;
+    font-weight: bold;
+    font-size: 0.9em;
+}
+.status-passed {
+    background: #d4edda;
+    color: #155724;
+}
+.status-failed {
+    background: #f8d7da;
+    color: #721c24;
+}
+.coverage-bar {
+    background: #e0e0e0;
+    height: 30px;
+    border-radius: 15px;
+    overflow: hidden;
+    margin: 10px 0;
+}
+.coverage-fill {
+    height: 100%;
+    background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
+    display: flex;
+    align-items: center;
+    justify-content: center;
+    color: white;
+    font-weight: bold;
+}
+.coverage-excellent { background: linear-gradient(90deg, #00c9ff 0%, #92fe9d 100%); }
+.coverage-good { background: linear-gradient(90deg, #667eea 0%, #764ba2 100%); }
+.coverage-fair { background: linear-gradient(90deg, #f093fb 0%, #f5576c 100%); }
+.coverage-poor { background: linear-gradient(90deg, #fa709a 0%, #fee140 100%); }
+.timestamp {
+    text-align: center;
+    color: #666;
+    margin-top: 30px;
+}
+"""
+
+# `go` directive of a go.mod file, e.g. "go 1.21.5"
+GO_DIRECTIVE_RE = re.compile(r'^go\s+(\d+(?:\.\d+)*)\s*$', re.M)
+
+def go_directive(go_mod: Path) -> Tuple[int, ...]:
+    """Go version a module's go.mod requires, as a comparable tuple"""
+    try:
+        match = GO_DIRECTIVE_RE.search(go_mod.read_text())
+    except OSError:
+        return ()
+    return tuple(int(part) for part in match.group(1).split(".")) if match else ()
+
+# HTML report fragments, filled in with str.format
+HTML_HEADER = """
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Test Coverage Report - {generated_at}</title>
+    <link rel="stylesheet" href="report.css">
+</head>
+<body>
+    <div class="header">
+        <h1>🚀 Test Coverage Report</h1>
+        <p>Kubernetes Continuous Deployment Project</p>
+        <p>{generated_at}</p>
+    </div>
+    
+"""
+
+HTML_SUMMARY = """    <div class="summary">
+        <div class="metric">
+            <div class="metric-value">{total_services}</div>
+            <div class="metric-label">Total Services</div>
+        </div>
+        <div class="metric">
+            <div class="metric-value">{passed}</div>
+            <div class="metric-label">✅ Passed</div>
+        </div>
+        <div class="metric">
+            <div class="metric-value">{failed}</div>
+            <div class="metric-label">❌ Failed</div>
+        </div>
+        <div class="metric">
+            <div class="metric-value">{average_coverage:.1f}%</div>
+            <div class="metric-label">📊 Average Coverage</div>
+        </div>
+        <div class="metric">
+            <div class="metric-value">{pass_rate}%</div>
+            <div class="metric-label">🎯 Pass Rate</div>
+        </div>
+    </div>
+    
+    <h2>Service Details</h2>
+"""
+
+HTML_SERVICE = """
+    <div class="service">
+        <div class="service-header">
+            <span class="service-name">{service_name}</span>
+            <span class="status-badge {status_class}">{status}</span>
+        </div>
+        <div class="coverage-bar">
+            <div class="coverage-fill {coverage_class}" style="width: {coverage}%">
+                {coverage:.1f}%
+            </div>
+        </div>
+{report_link}    </div>
+"""
+
+HTML_REPORT_LINK = '        <a href="{html_report}" target="_blank">View Detailed Coverage Report →</a>\n'
+
+HTML_FOOTER = """
+    <div class="timestamp">
+        Generated at {generated_at}
+    </div>
+</body>
+</html>
+"""
+
 
 class AutomatedReporter:
     def __init__(self, project_root: str = "."):
@@ -34,47 +222,97 @@ class AutomatedReporter:
             "services/typeahead",
         ]
         
+        # Services are tested concurrently; split the CPU budget between them
+        # so the go test processes don't oversubscribe the runner
+        self.max_workers = min(len(self.services), os.cpu_count() or 1)
+        self.go_parallel = max(1, (os.cpu_count() or 1) // self.max_workers)
+        
+        # One clock reading per run, so every report artifact agrees on it
+        self._run_started = datetime.now()
+        
         self.results = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": self._run_started.isoformat(),
             "services": {},
             "summary": {},
             "trends": {},
         }
     
-    def run_command(self, cmd: List[str], cwd: Path) -> Tuple[int, str, str]:
-        """Run a command and return exit code, stdout, stderr"""
+    def run_command(self, cmd: List[str], cwd: Path, text: bool = True,
+                    max_lines: Optional[int] = 10000,
+                    env: Optional[Dict[str, str]] = None) -> Tuple[int, str, str]:
+        """Run a command and return exit code, stdout, stderr
+        
+        Output is streamed and only the last max_lines lines of each stream
+        are kept (max_lines=None keeps everything). With text=False the
+        output is returned as raw bytes.
+        """
+        import subprocess
+        
+        empty = "" if text else b""
         try:
-            result = subprocess.run(
+            proc = subprocess.Popen(
                 cmd,
                 cwd=cwd,
-                capture_output=True,
-                text=True,
-                timeout=300
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=text,
+                env=env
             )
-            return result.returncode, result.stdout, result.stderr
-        except subprocess.TimeoutExpired:
-            return -1, "", "Command timed out"
         except Exception as e:
-            return -1, "", str(e)
+            return -1, empty, str(e)
+        
+        # Drain stderr on a helper thread so a chatty stderr can't fill the
+        # pipe and stall the child while we read stdout
+        stderr_tail = deque(maxlen=max_lines)
+        drain = threading.Thread(target=stderr_tail.extend, args=(proc.stderr,), daemon=True)
+        drain.start()
+        
+        timed_out = threading.Event()
+        def kill():
+            timed_out.set()
+            proc.kill()
+        timer = threading.Timer(300, kill)
+        timer.start()
+        try:
+            stdout_tail = deque(proc.stdout, maxlen=max_lines)
+            drain.join()
+            proc.wait()
+        finally:
+            timer.cancel()
+        
+        if timed_out.is_set():
+            return -1, empty, "Command timed out"
+        return proc.returncode, empty.join(stdout_tail), empty.join(stderr_tail)
     
     def get_service_coverage(self, service_path: Path) -> Dict:
         """Get coverage information for a service"""
         print(f"  📊 Analyzing coverage for {service_path.name}...")
         
+        # Each service writes its own profile so concurrent runs never collide
+        profile = self.report_dir / f"coverage_{service_path.name}.out"
+        
         # Run tests
-        cmd = ["go", "test", "-tags=unit", "-v", "-coverprofile=coverage.out", "./..."]
+        cmd = [
+            "go", "test", "-tags=unit",
+            f"-p={self.go_parallel}", f"-parallel={self.go_parallel}",
+            f"-coverprofile={profile}", "./..."
+        ]
         exit_code, stdout, stderr = self.run_command(cmd, service_path)
         
         if exit_code != 0:
-            return {
+            result = {
                 "status": "FAILED",
                 "coverage": 0.0,
                 "error": stderr or stdout
             }
+            failure_detail = self.rerun_failed_verbose(stdout, service_path)
+            if failure_detail:
+                result["failure_detail"] = failure_detail
+            return result
         
         # Get coverage percentage
-        cmd = ["go", "tool", "cover", "-func=coverage.out"]
-        exit_code, stdout, stderr = self.run_command(cmd, service_path)
+        cmd = ["go", "tool", "cover", f"-func={profile}"]
+        exit_code, stdout, stderr = self.run_command(cmd, service_path, text=False, max_lines=None)
         
         if exit_code != 0:
             return {
@@ -83,81 +321,182 @@ class AutomatedReporter:
                 "details": "No coverage data"
             }
         
-        # Parse coverage
+        # Parse coverage into parallel columns rather than a dict per function
         total_coverage = 0.0
-        function_coverage = []
-        
-        for line in stdout.split('\n'):
-            if line.strip():
-                parts = line.split()
-                if len(parts) >= 3:
-                    func_name = parts[1] if len(parts) > 2 else parts[0]
-                    coverage_str = parts[-1].rstrip('%')
-                    try:
-                        coverage = float(coverage_str)
-                        if 'total:' in line:
-                            total_coverage = coverage
-                        else:
-                            function_coverage.append({
-                                "function": func_name,
-                                "coverage": coverage
-                            })
-                    except ValueError:
-                        pass
-        
-        # Generate HTML report
-        html_path = service_path / "coverage.html"
-        cmd = ["go", "tool", "cover", "-html=coverage.out", "-o", str(html_path)]
-        self.run_command(cmd, service_path)
+        functions = []
+        coverages = array.array('d')
         
+        for location, func_name, coverage in COVER_FUNC_RE.findall(stdout):
+            if location == b"total:":
+                total_coverage = float(coverage)
+            else:
+                functions.append(func_name.decode())
+                coverages.append(float(coverage))
+        
+        # The HTML report is rendered for all services at once afterwards
         return {
             "status": "PASSED",
             "coverage": total_coverage,
-            "function_coverage": function_coverage,
-            "html_report": str(html_path.relative_to(self.project_root))
+            "functions": functions,
+            "coverages": coverages.tolist(),
+            "function_stats": self.summarize_function_coverage(coverages)
+        }
+    
+    @staticmethod
+    def summarize_function_coverage(coverages: Sequence[float]) -> Dict:
+        """Mean, median and 95th percentile of per-function coverage"""
+        if not coverages:
+            return {"mean": 0.0, "p50": 0.0, "p95": 0.0}
+        if len(coverages) == 1:
+            return {"mean": coverages[0], "p50": coverages[0], "p95": coverages[0]}
+        
+        return {
+            "mean": round(statistics.fmean(coverages), 2),
+            "p50": statistics.median(coverages),
+            "p95": round(statistics.quantiles(coverages, n=20, method="inclusive")[-1], 2)
         }
     
+    def rerun_failed_verbose(self, stdout: str, service_path: Path) -> Optional[str]:
+        """Re-run only the failed tests with -v and return their output"""
+        failed_tests = sorted({name.split("/")[0] for name in FAILED_TEST_RE.findall(stdout)})
+        failed_packages = FAILED_PACKAGE_RE.findall(stdout)
+        if not failed_tests or not failed_packages:
+            return None
+        
+        cmd = [
+            "go", "test", "-tags=unit", "-v",
+            f"-run=^({'|'.join(failed_tests)})$", *failed_packages
+        ]
+        _, detail, _ = self.run_command(cmd, service_path)
+        return detail
+    
+    def generate_coverage_html(self, service_paths: List[Path]):
+        """Render the HTML coverage report for services that produced a profile
+        
+        The profiles are merged and rendered by a single `go tool cover`
+        invocation, using a throwaway go.work so every service module
+        resolves. If that fails, each service gets its own report instead.
+        """
+        if not service_paths:
+            return
+        
+        merged_profile = self.report_dir / "coverage_merged.out"
+        with open(merged_profile, 'w') as merged:
+            for i, service_path in enumerate(service_paths):
+                with open(self.report_dir / f"coverage_{service_path.name}.out") as profile:
+                    header = profile.readline()
+                    if i == 0:
+                        merged.write(header)
+                    merged.writelines(profile)
+        
+        workspace = self.report_dir / "go.work"
+        uses = "".join(
+            f"\t{os.path.relpath(service_path, self.report_dir)}\n" for service_path in service_paths
+        )
+        # The workspace must require at least the newest go version any of
+        # its modules declares, or the go command refuses to load it
+        go_version = max((go_directive(path / "go.mod") for path in service_paths), default=())
+        go_version = ".".join(map(str, go_version or (1, 21)))
+        workspace.write_text(f"go {go_version}\n\nuse (\n{uses})\n")
+        
+        html_path = self.report_dir / "coverage_combined.html"
+        cmd = ["go", "tool", "cover", f"-html={merged_profile}", "-o", str(html_path)]
+        exit_code, _, stderr = self.run_command(
+            cmd, self.project_root, env={**os.environ, "GOWORK": str(workspace)}
+        )
+        workspace.unlink()
+        
+        if exit_code == 0:
+            for service_path in service_paths:
+                self.results["services"][service_path.name]["html_report"] = \
+                    str(html_path.relative_to(self.project_root))
+            return
+        
+        print(f"  ⚠️  Combined coverage report failed, rendering per service: {stderr.strip()}")
+        
+        def render(service_path: Path):
+            profile = self.report_dir / f"coverage_{service_path.name}.out"
+            service_html = service_path / "coverage.html"
+            cmd = ["go", "tool", "cover", f"-html={profile}", "-o", str(service_html)]
+            exit_code, _, _ = self.run_command(cmd, service_path)
+            if exit_code == 0:
+                self.results["services"][service_path.name]["html_report"] = \
+                    str(service_html.relative_to(self.project_root))
+        
+        from concurrent.futures import ThreadPoolExecutor
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            list(executor.map(render, service_paths))
+    
     def analyze_all_services(self):
         """Analyze all services and generate reports"""
         print("\n" + "="*80)
         print("AUTOMATED REPORTING SYSTEM")
         print("="*80)
-        print(f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        print(f"Timestamp: {self._run_started.strftime('%Y-%m-%d %H:%M:%S')}")
         print(f"Project Root: {self.project_root}")
         print("="*80 + "\n")
         
-        total_coverage = 0.0
+        passed_coverages = []
         passed_count = 0
         failed_count = 0
         
+        # List each parent directory once instead of stat()ing every service
+        existing = set()
+        for parent in {os.path.dirname(service) for service in self.services}:
+            try:
+                with os.scandir(self.project_root / parent) as entries:
+                    existing.update(
+                        os.path.join(parent, entry.name) for entry in entries if entry.is_dir()
+                    )
+            except OSError:
+                pass
+        
+        service_paths = []
         for service_path_str in self.services:
             service_path = self.project_root / service_path_str
-            service_name = service_path.name
-            
-            print(f"\n{'─'*60}")
-            print(f"Service: {service_name}")
-            print(f"{'─'*60}")
-            
-            if not service_path.exists():
+            if service_path_str not in existing:
                 print(f"  ⚠️  Service directory not found: {service_path}")
                 continue
+            service_paths.append(service_path)
+        
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+        
+        # go test spends its time in subprocesses, so threads are enough to
+        # run the services side by side
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(self.get_service_coverage, service_path): service_path.name
+                for service_path in service_paths
+            }
             
-            result = self.get_service_coverage(service_path)
-            self.results["services"][service_name] = result
-            
-            if result["status"] == "PASSED":
-                passed_count += 1
-                total_coverage += result["coverage"]
-                print(f"  ✅ Status: PASSED")
-                print(f"  📈 Coverage: {result['coverage']:.1f}%")
-            else:
-                failed_count += 1
-                print(f"  ❌ Status: FAILED")
-                print(f"  ❗ Error: {result.get('error', 'Unknown error')}")
+            for future in as_completed(futures):
+                service_name = futures[future]
+                result = future.result()
+                self.results["services"][service_name] = result
+                
+                print(f"\n{'─'*60}")
+                print(f"Service: {service_name}")
+                print(f"{'─'*60}")
+                
+                if result["status"] == "PASSED":
+                    passed_count += 1
+                    passed_coverages.append(result["coverage"])
+                    print(f"  ✅ Status: PASSED")
+                    print(f"  📈 Coverage: {result['coverage']:.1f}%")
+                else:
+                    failed_count += 1
+                    print(f"  ❌ Status: FAILED")
+                    print(f"  ❗ Error: {result.get('error', 'Unknown error')}")
+        
+        self.generate_coverage_html([
+            service_path for service_path in service_paths
+            if "functions" in self.results["services"][service_path.name]
+        ])
         
         # Calculate summary
         total_services = passed_count + failed_count
-        avg_coverage = total_coverage / passed_count if passed_count > 0 else 0.0
+        avg_coverage = statistics.fmean(passed_coverages) if passed_coverages else 0.0
         
         self.results["summary"] = {
             "total_services": total_services,
@@ -176,142 +515,61 @@ class AutomatedReporter:
         print(f"📊 Average Coverage: {avg_coverage:.2f}%")
         print(f"🎯 Pass Rate: {self.results['summary']['pass_rate']}%")
         print("="*80 + "\n")
+        
+        self.update_trends()
+    
+    def update_trends(self, window_days: int = 30):
+        """Record this run's coverage in trends.db and compute per-service trends
+        
+        Each service gets its average coverage over the last window_days and
+        the change since its previous recorded run (None if this run failed).
+        """
+        run_ts = int(self._run_started.timestamp())
+        rows = [
+            (run_ts, service_name, result["coverage"])
+            for service_name, result in self.results["services"].items()
+            if result["status"] == "PASSED"
+        ]
+        
+        with sqlite3.connect(self.report_dir / "trends.db") as db:
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS cov("
+                "ts INTEGER, service TEXT, pct REAL, PRIMARY KEY(ts, service))"
+            )
+            db.executemany("INSERT OR REPLACE INTO cov VALUES(?, ?, ?)", rows)
+            
+            averages = db.execute(
+                "SELECT service, AVG(pct) FROM cov WHERE ts > ? GROUP BY service",
+                (run_ts - window_days * 86400,)
+            ).fetchall()
+            previous = dict(db.execute(
+                "SELECT service, pct FROM cov AS c WHERE ts = ("
+                "SELECT MAX(ts) FROM cov WHERE service = c.service AND ts < ?)",
+                (run_ts,)
+            ).fetchall())
+        db.close()
+        
+        trends = {}
+        for service_name, average in averages:
+            trend = {f"average_{window_days}d": round(average, 2)}
+            result = self.results["services"].get(service_name)
+            if service_name in previous and result is not None:
+                # Failed runs record no coverage, so there is nothing to compare
+                trend["delta"] = (
+                    round(result["coverage"] - previous[service_name], 2)
+                    if result["status"] == "PASSED" else None
+                )
+            trends[service_name] = trend
+        self.results["trends"] = trends
     
     def generate_html_report(self) -> str:
         """Generate HTML report"""
-        html = f"""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Test Coverage Report - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</title>
-    <style>
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            max-width: 1200px;
-            margin: 0 auto;
-            padding: 20px;
-            background: #f5f5f5;
-        }}
-        .header {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 30px;
-            border-radius: 10px;
-            margin-bottom: 30px;
-        }}
-        .summary {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 20px;
-            margin-bottom: 30px;
-        }}
-        .metric {{
-            background: white;
-            padding: 20px;
-            border-radius: 10px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        .metric-value {{
-            font-size: 2.5em;
-            font-weight: bold;
-            color: #667eea;
-        }}
-        .metric-label {{
-            color: #666;
-            margin-top: 10px;
-        }}
-        .service {{
-            background: white;
-            padding: 20px;
-            margin-bottom: 15px;
-            border-radius: 10px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        .service-header {{
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: 15px;
-        }}
-        .service-name {{
-            font-size: 1.2em;
-            font-weight: bold;
-        }}
-        .status-badge {{
-            padding: 5px 15px;
-            border-radius: 20px;
-            font-weight: bold;
-            font-size: 0.9em;
-        }}
-        .status-passed {{
-            background: #d4edda;
-            color: #155724;
-        }}
-        .status-failed {{
-            background: #f8d7da;
-            color: #721c24;
-        }}
-        .coverage-bar {{
-            background: #e0e0e0;
-            height: 30px;
-            border-radius: 15px;
-            overflow: hidden;
-            margin: 10px 0;
-        }}
-        .coverage-fill {{
-            height: 100%;
-            background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            color: white;
-            font-weight: bold;
-        }}
-        .coverage-excellent {{ background: linear-gradient(90deg, #00c9ff 0%, #92fe9d 100%); }}
-        .coverage-good {{ background: linear-gradient(90deg, #667eea 0%, #764ba2 100%); }}
-        .coverage-fair {{ background: linear-gradient(90deg, #f093fb 0%, #f5576c 100%); }}
-        .coverage-poor {{ background: linear-gradient(90deg, #fa709a 0%, #fee140 100%); }}
-        .timestamp {{
-            text-align: center;
-            color: #666;
-            margin-top: 30px;
-        }}
-    </style>
-</head>
-<body>
-    <div class="header">
-        <h1>🚀 Test Coverage Report</h1>
-        <p>Kubernetes Continuous Deployment Project</p>
-        <p>{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-    </div>
-    
-    <div class="summary">
-        <div class="metric">
-            <div class="metric-value">{self.results['summary']['total_services']}</div>
-            <div class="metric-label">Total Services</div>
-        </div>
-        <div class="metric">
-            <div class="metric-value">{self.results['summary']['passed']}</div>
-            <div class="metric-label">✅ Passed</div>
-        </div>
-        <div class="metric">
-            <div class="metric-value">{self.results['summary']['failed']}</div>
-            <div class="metric-label">❌ Failed</div>
-        </div>
-        <div class="metric">
-            <div class="metric-value">{self.results['summary']['average_coverage']:.1f}%</div>
-            <div class="metric-label">📊 Average Coverage</div>
-        </div>
-        <div class="metric">
-            <div class="metric-value">{self.results['summary']['pass_rate']}%</div>
-            <div class="metric-label">🎯 Pass Rate</div>
-        </div>
-    </div>
-    
-    <h2>Service Details</h2>
-"""
+        generated_at = self._run_started.strftime('%Y-%m-%d %H:%M:%S')
+        
+        buf = io.StringIO()
+        write = buf.write
+        write(HTML_HEADER.format(generated_at=generated_at))
+        write(HTML_SUMMARY.format(**self.results['summary']))
         
         for service_name, result in sorted(self.results['services'].items()):
             status_class = "status-passed" if result['status'] == "PASSED" else "status-failed"
@@ -326,47 +584,55 @@ class AutomatedReporter:
             else:
                 coverage_class = "coverage-poor"
             
-            html += f"""
-    <div class="service">
-        <div class="service-header">
-            <span class="service-name">{service_name}</span>
-            <span class="status-badge {status_class}">{result['status']}</span>
-        </div>
-        <div class="coverage-bar">
-            <div class="coverage-fill {coverage_class}" style="width: {coverage}%">
-                {coverage:.1f}%
-            </div>
-        </div>
-"""
             if result['status'] == "PASSED" and 'html_report' in result:
-                html += f'        <a href="{result["html_report"]}" target="_blank">View Detailed Coverage Report →</a>\n'
+                report_link = HTML_REPORT_LINK.format(html_report=result['html_report'])
+            else:
+                report_link = ""
             
-            html += "    </div>\n"
+            write(HTML_SERVICE.format(
+                service_name=service_name,
+                status_class=status_class,
+                status=result['status'],
+                coverage_class=coverage_class,
+                coverage=coverage,
+                report_link=report_link
+            ))
         
-        html += f"""
-    <div class="timestamp">
-        Generated at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-    </div>
-</body>
-</html>
-"""
-        return html
+        write(HTML_FOOTER.format(generated_at=generated_at))
+        return buf.getvalue()
     
     def save_reports(self):
         """Save all reports"""
         # Save JSON report
-        json_path = self.report_dir / f"report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(json_path, 'w') as f:
-            json.dump(self.results, f, indent=2)
+        json_path = self.report_dir / f"report_{self._run_started.strftime('%Y%m%d_%H%M%S')}.json"
+        try:
+            import orjson
+        except ImportError:  # optional, stdlib json is used as a fallback
+            import json
+            with open(json_path, 'w') as f:
+                json.dump(self.results, f, indent=2)
+        else:
+            json_path.write_bytes(orjson.dumps(self.results, option=orjson.OPT_INDENT_2))
         print(f"✅ JSON report saved: {json_path}")
         
-        # Save latest JSON (for trend tracking)
+        # Save latest JSON (for trend tracking) as a link to the same bytes
         latest_json = self.report_dir / "latest.json"
-        with open(latest_json, 'w') as f:
-            json.dump(self.results, f, indent=2)
+        latest_json.unlink(missing_ok=True)
+        try:
+            os.link(json_path, latest_json)
+        except OSError:
+            shutil.copyfile(json_path, latest_json)
         print(f"✅ Latest report saved: {latest_json}")
         
-        # Save HTML report
+        # Save HTML report; its stylesheet is only rewritten when it changed
+        css_path = self.report_dir / "report.css"
+        try:
+            css_current = css_path.read_text() == REPORT_CSS
+        except OSError:
+            css_current = False
+        if not css_current:
+            css_path.write_text(REPORT_CSS)
+        
         html_path = self.report_dir / "test_report.html"
         with open(html_path, 'w') as f:
             f.write(self.generate_html_report())
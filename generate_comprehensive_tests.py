@@ -5,32 +5,91 @@ Automatically generate comprehensive test coverage for all Go services
 
 import os
 import re
+import json
 import subprocess
 from pathlib import Path
 
+# Handlers, service methods and helper functions in one pass over the file;
+# the named group that matched last says which kind of declaration it is.
+# A helper's result list stops at the end of its line, so a declaration
+# without a body can't swallow the ones after it.
+HELPER_DECL = rb'^func (?P<helper>\w+)\([^)]*\) [^{\n]*{'
+GO_DECL_RE = re.compile(
+    rb'func (?P<handler>\w+Handler)\(w http\.ResponseWriter, r \*http\.Request\)'
+    rb'|func \(s \*(?P<receiver>\w+Service)\) (?P<method>\w+)\([^)]*\)'
+    rb'|' + HELPER_DECL,
+    re.MULTILINE
+)
+# Files without handler or service method literals only need the helper scan
+GO_HELPER_RE = re.compile(HELPER_DECL, re.MULTILINE)
+
 def analyze_go_file(file_path):
     """Analyze a Go file to find handlers and functions that need testing"""
-    with open(file_path, 'r') as f:
+    # Go source is matched as bytes; only the captured names are decoded
+    with open(file_path, 'rb') as f:
         content = f.read()
     
-    # Find all HTTP handlers
-    handlers = re.findall(r'func (\w+Handler)\(w http\.ResponseWriter, r \*http\.Request\)', content)
+    if b'Handler(w http.ResponseWriter' in content or b'Service) ' in content:
+        pattern = GO_DECL_RE
+    else:
+        pattern = GO_HELPER_RE
     
-    # Find all service methods
-    methods = re.findall(r'func \(s \*\w+Service\) (\w+)\([^)]*\)', content)
+    found = {'handler': [], 'method': [], 'receiver': [], 'helper': []}
+    for match in pattern.finditer(content):
+        kind = match.lastgroup
+        found[kind].append(match[kind].decode('ascii'))
+        if kind == 'method':
+            # The same method name on two services is two methods
+            found['receiver'].append(match['receiver'].decode('ascii'))
     
-    # Find helper functions
-    helpers = re.findall(r'^func (\w+)\([^)]*\) [^{]*{', content, re.MULTILINE)
-    helpers = [h for h in helpers if not h.endswith('Handler') and h != 'main']
+    helpers = [h for h in found['helper'] if not h.endswith('Handler') and h != 'main']
     
+    # Duplicates are dropped in source order, methods per receiver
+    methods = dict.fromkeys(zip(found['receiver'], found['method']))
     return {
-        'handlers': handlers,
-        'methods': methods,
+        'handlers': list(dict.fromkeys(found['handler'])),
+        'methods': [name for _, name in methods],
         'helpers': list(set(helpers))
     }
 
+# Coverage gaps per service directory, keyed on the size and mtime of its
+# coverage.out and kept across runs so an unchanged profile is not re-read
+GAP_CACHE_PATH = Path.home() / '.cache' / 'go-cov-gaps.json'
+_gap_cache = None
+
+def load_gap_cache():
+    """Load the on-disk coverage gap cache once per process"""
+    global _gap_cache
+    if _gap_cache is None:
+        try:
+            with open(GAP_CACHE_PATH, 'r') as f:
+                _gap_cache = json.load(f)
+        except (OSError, ValueError):
+            _gap_cache = {}
+    return _gap_cache
+
+def save_gap_cache():
+    """Write the coverage gap cache back to disk"""
+    try:
+        GAP_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with open(GAP_CACHE_PATH, 'w') as f:
+            json.dump(_gap_cache, f)
+    except OSError as e:
+        print(f"Warning: could not save coverage gap cache: {e}")
+
 def get_coverage_gaps(service_dir):
     """Run coverage and identify gaps"""
+    try:
+        stat = os.stat(os.path.join(service_dir, 'coverage.out'))
+    except OSError:
+        return []
+    
+    cache = load_gap_cache()
+    key = str(Path(service_dir).resolve())
+    entry = cache.get(key)
+    if entry and entry['size'] == stat.st_size and entry['mtime_ns'] == stat.st_mtime_ns:
+        return [tuple(gap) for gap in entry['gaps']]
+    
     try:
         result = subprocess.run(
             ['go', 'tool', 'cover', '-func=coverage.out'],
@@ -52,6 +111,8 @@ def get_coverage_gaps(service_dir):
                     if coverage < 100:
                         gaps.append((func_name, coverage))
         
+        cache[key] = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'gaps': gaps}
+        save_gap_cache()
         return gaps
     except Exception as e:
         print(f"Error analyzing coverage: {e}")
@@ -61,12 +122,12 @@ def main():
     project_root = Path('/home/calelin/dev/continuous-deployment-on-kubernetes')
     
     services = [
-        'services/dns',
-        'services/webcrawler',
-        'services/newsfeed',
-        'services/loadbalancer',
-        'services/tinyurl',
-        'services/typeahead',
+        'dns',
+        'webcrawler',
+        'newsfeed',
+        'loadbalancer',
+        'tinyurl',
+        'typeahead',
     ]
     
     print("=" * 80)
@@ -74,16 +135,23 @@ def main():
     print("=" * 80)
     print()
     
-    for service_path in services:
-        service_dir = project_root / service_path
-        service_name = service_path.split('/')[-1]
+    # List the services directory once instead of building and stat'ing a
+    # path per service
+    try:
+        with os.scandir(project_root / 'services') as it:
+            service_dirs = {entry.name: entry.path for entry in it if entry.is_dir()}
+    except OSError:
+        service_dirs = {}
+    
+    for service_name in services:
+        service_dir = service_dirs.get(service_name)
         
         print(f"\n{'='*60}")
         print(f"Service: {service_name}")
         print(f"{'='*60}")
         
-        main_go = service_dir / 'main.go'
-        if not main_go.exists():
+        main_go = os.path.join(service_dir, 'main.go') if service_dir else None
+        if main_go is None or not os.path.isfile(main_go):
             print(f"  ⚠️  main.go not found")
             continue
         
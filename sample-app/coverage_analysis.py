@@ -4,12 +4,28 @@ Coverage Analysis Script for Kubernetes Continuous Deployment Project
 This script analyzes test coverage and provides recommendations for improvement.
 """
 
+import io
+import re
 import json
+import bisect
 import subprocess
 import sys
+from contextlib import redirect_stdout
 from pathlib import Path
 from typing import Dict, List, Tuple
 
+# Per-file grading: below 70% needs improvement, then acceptable, good and
+# excellent from 70, 80 and 90%
+FILE_THRESHOLDS = (70, 80, 90)
+FILE_STATUSES = ("needs_improvement", "acceptable", "good", "excellent")
+
+# Overall grade and emoji by how many of minimum, target and excellent are met
+OVERALL_STATUSES = (("poor", "❌"), ("acceptable", "⚠️"), ("good", "✅"), ("excellent", "🎉"))
+
+# One row of `go tool cover -func` output: location, function, percentage.
+# Columns are padded with one or more tabs.
+COVER_LINE_RE = re.compile(r'^(?P<location>\S+)\s+(?P<name>\S+)\s+(?P<coverage>\d+(?:\.\d+)?)%', re.MULTILINE)
+
 class CoverageAnalyzer:
     def __init__(self, project_root: str = "."):
         self.project_root = Path(project_root).resolve()
@@ -46,15 +62,12 @@ class CoverageAnalyzer:
         """Run coverage analysis and return results"""
         print("🔍 Running coverage analysis...")
         
-        # Change to sample-app directory
-        import os
-        os.chdir(self.sample_app_dir)
-        
-        # Run tests with coverage
+        # Run tests with coverage from the sample-app directory; only the
+        # profile and stderr are used, so the test output is not buffered
         result = subprocess.run([
-            "go", "test", "-v", "-coverprofile=coverage.out", 
+            "go", "test", "-coverprofile=coverage.out", 
             "-covermode=atomic", "-tags=unit", "./..."
-        ], capture_output=True, text=True)
+        ], cwd=self.sample_app_dir, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
         
         if result.returncode != 0:
             print(f"❌ Tests failed: {result.stderr}")
@@ -63,7 +76,7 @@ class CoverageAnalyzer:
         # Generate coverage report
         coverage_result = subprocess.run([
             "go", "tool", "cover", "-func=coverage.out"
-        ], capture_output=True, text=True)
+        ], cwd=self.sample_app_dir, capture_output=True, text=True)
         
         if coverage_result.returncode != 0:
             print(f"❌ Coverage analysis failed: {coverage_result.stderr}")
@@ -86,61 +99,23 @@ class CoverageAnalyzer:
     
     def parse_coverage_output(self, output: str) -> Dict:
         """Parse coverage output from go tool cover"""
-        lines = output.strip().split('\n')
         coverage_data = {
             "files": {},
             "total": {}
         }
         
-        for line in lines:
-            if line.strip():
-                # Check for total line first
-                if "total:" in line:
-                    # Handle format: "total:\t\t(statements)\t84.7%"
-                    # Split by tab and find the percentage
-                    all_parts = line.split('\t')
-                    for part in all_parts:
-                        if '%' in part:
-                            coverage_str = part.replace('%', '')
-                            try:
-                                coverage = float(coverage_str)
-                                coverage_data["total"] = {
-                                    "coverage": coverage,
-                                    "statements": "0"
-                                }
-                                break
-                            except ValueError:
-                                continue
-                else:
-                    parts = line.split('\t')
-                    if len(parts) >= 3:
-                        file_path = parts[0]
-                        coverage_str = parts[2].replace('%', '')
-                        
-                        try:
-                            coverage = float(coverage_str)
-                            coverage_data["files"][file_path] = {
-                                "coverage": coverage,
-                                "statements": parts[1] if len(parts) > 1 else "0"
-                            }
-                        except ValueError:
-                            continue
-        
-        # If no total found, try to extract from the last line
-        if not coverage_data["total"] and lines:
-            last_line = lines[-1]
-            if "total:" in last_line:
-                parts = last_line.split('\t')
-                if len(parts) >= 3:
-                    coverage_str = parts[2].replace('%', '')
-                    try:
-                        coverage = float(coverage_str)
-                        coverage_data["total"] = {
-                            "coverage": coverage,
-                            "statements": parts[1] if len(parts) > 1 else "0"
-                        }
-                    except ValueError:
-                        pass
+        # The total row has the same shape: "total:\t\t(statements)\t84.7%"
+        for match in COVER_LINE_RE.finditer(output):
+            if match["location"] == "total:":
+                coverage_data["total"] = {
+                    "coverage": float(match["coverage"]),
+                    "statements": "0"
+                }
+            else:
+                coverage_data["files"][match["location"]] = {
+                    "coverage": float(match["coverage"]),
+                    "statements": match["name"]
+                }
         
         return coverage_data
     
@@ -154,47 +129,33 @@ class CoverageAnalyzer:
         
         requirements = self.coverage_config["coverage_requirements"]["overall"]
         
-        # Determine status
-        if total_coverage >= requirements["excellent"]:
-            status = "excellent"
-            status_emoji = "🎉"
-        elif total_coverage >= requirements["target"]:
-            status = "good"
-            status_emoji = "✅"
-        elif total_coverage >= requirements["minimum"]:
-            status = "acceptable"
-            status_emoji = "⚠️"
-        else:
-            status = "poor"
-            status_emoji = "❌"
+        # Determine status: the number of thresholds reached picks the grade
+        thresholds = (requirements["minimum"], requirements["target"], requirements["excellent"])
+        level = bisect.bisect_right(thresholds, total_coverage)
+        status, status_emoji = OVERALL_STATUSES[level]
         
-        # Analyze individual files
-        file_analysis = {}
-        for file_path, data in coverage_data["files"].items():
-            file_coverage = data["coverage"]
-            
-            if file_coverage >= 90:
-                file_status = "excellent"
-            elif file_coverage >= 80:
-                file_status = "good"
-            elif file_coverage >= 70:
-                file_status = "acceptable"
-            else:
-                file_status = "needs_improvement"
-            
-            file_analysis[file_path] = {
+        # Analyze individual files: pull the percentages into one column and
+        # grade each against the thresholds with a binary search
+        paths = list(coverage_data["files"])
+        coverages = [data["coverage"] for data in coverage_data["files"].values()]
+        statuses = [FILE_STATUSES[bisect.bisect_right(FILE_THRESHOLDS, c)] for c in coverages]
+        
+        file_analysis = {
+            file_path: {
                 "coverage": file_coverage,
                 "status": file_status,
-                "needs_attention": file_coverage < 70
+                "needs_attention": file_coverage < FILE_THRESHOLDS[0]
             }
+            for file_path, file_coverage, file_status in zip(paths, coverages, statuses)
+        }
         
         return {
             "total_coverage": total_coverage,
             "status": status,
             "status_emoji": status_emoji,
-            "meets_minimum": total_coverage >= requirements["minimum"],
-            "meets_target": total_coverage >= requirements["target"],
-            "meets_excellent": total_coverage >= requirements["excellent"],
+            "meets_minimum": level >= 1,
+            "meets_target": level >= 2,
+            "meets_excellent": level >= 3,
             "file_analysis": file_analysis,
             "requirements": requirements
         }
@@ -220,27 +181,29 @@ class CoverageAnalyzer:
             recommendations.append(f"🎉 Excellent coverage of {total_coverage:.1f}%!")
             recommendations.append("Maintain current coverage levels and focus on test quality")
         
-        # File-specific recommendations
-        files_needing_attention = [
-            file_path for file_path, data in analysis["file_analysis"].items()
-            if data["needs_attention"]
-        ]
+        # File-specific recommendations: one pass collects both the files
+        # needing attention and the file-type specific advice
+        files_needing_attention = []
+        attention_details = []
+        file_type_recommendations = []
+        for file_path, data in analysis["file_analysis"].items():
+            file_coverage = data["coverage"]
+            if data["needs_attention"]:
+                files_needing_attention.append(file_path)
+                attention_details.append(f"  - {file_path}: {file_coverage:.1f}% (target: 70%+)")
+            
+            if "main.go" in file_path and file_coverage < 80:
+                file_type_recommendations.append("Consider adding more tests for main.go error handling and edge cases")
+            elif "test" in file_path and file_coverage < 100:
+                file_type_recommendations.append(f"Test file {file_path} should have 100% coverage")
+            elif file_coverage < 70:
+                file_type_recommendations.append(f"Add comprehensive tests for {file_path}")
         
         if files_needing_attention:
             recommendations.append(f"Files needing attention: {', '.join(files_needing_attention)}")
-            
-            for file_path in files_needing_attention:
-                file_data = analysis["file_analysis"][file_path]
-                recommendations.append(f"  - {file_path}: {file_data['coverage']:.1f}% (target: 70%+)")
+            recommendations.extend(attention_details)
         
-        # Specific recommendations based on file types
-        for file_path, data in analysis["file_analysis"].items():
-            if "main.go" in file_path and data["coverage"] < 80:
-                recommendations.append("Consider adding more tests for main.go error handling and edge cases")
-            elif "test" in file_path and data["coverage"] < 100:
-                recommendations.append(f"Test file {file_path} should have 100% coverage")
-            elif data["coverage"] < 70:
-                recommendations.append(f"Add comprehensive tests for {file_path}")
+        recommendations.extend(file_type_recommendations)
         
         return recommendations
     
@@ -250,46 +213,50 @@ class CoverageAnalyzer:
             print(f"❌ Error: {results['error']}")
             return
         
-        analysis = results["analysis"]
-        recommendations = results["recommendations"]
-        
-        print(f"\n📊 Coverage Analysis Results")
-        print(f"{'='*50}")
-        print(f"Total Coverage: {analysis['total_coverage']:.1f}% {analysis['status_emoji']}")
-        print(f"Status: {analysis['status'].upper()}")
-        print(f"Meets Minimum ({analysis['requirements']['minimum']}%): {'✅' if analysis['meets_minimum'] else '❌'}")
-        print(f"Meets Target ({analysis['requirements']['target']}%): {'✅' if analysis['meets_target'] else '❌'}")
-        print(f"Meets Excellent ({analysis['requirements']['excellent']}%): {'✅' if analysis['meets_excellent'] else '❌'}")
-        
-        print(f"\n📁 File-by-File Analysis")
-        print(f"{'='*50}")
-        for file_path, data in analysis["file_analysis"].items():
-            status_emoji = "🎉" if data["status"] == "excellent" else "✅" if data["status"] == "good" else "⚠️" if data["status"] == "acceptable" else "❌"
-            print(f"{file_path}: {data['coverage']:.1f}% {status_emoji}")
-        
-        print(f"\n💡 Recommendations")
-        print(f"{'='*50}")
-        for i, rec in enumerate(recommendations, 1):
-            print(f"{i}. {rec}")
-        
-        print(f"\n🎯 Next Steps")
-        print(f"{'='*50}")
-        if analysis["meets_excellent"]:
-            print("1. Maintain current coverage levels")
-            print("2. Focus on test quality and maintainability")
-            print("3. Consider property-based testing")
-        elif analysis["meets_target"]:
-            print("1. Focus on edge cases and error handling")
-            print("2. Add integration tests for complex scenarios")
-            print("3. Improve test coverage for low-coverage files")
-        elif analysis["meets_minimum"]:
-            print("1. Increase coverage to reach target (80%)")
-            print("2. Add tests for critical functionality")
-            print("3. Focus on files with lowest coverage")
-        else:
-            print("1. Prioritize increasing coverage to meet minimum (70%)")
-            print("2. Add basic tests for all major functions")
-            print("3. Focus on critical paths and error handling")
+        # Render into a buffer and write it out in one go
+        buf = io.StringIO()
+        with redirect_stdout(buf):
+            analysis = results["analysis"]
+            recommendations = results["recommendations"]
+            
+            print(f"\n📊 Coverage Analysis Results")
+            print(f"{'='*50}")
+            print(f"Total Coverage: {analysis['total_coverage']:.1f}% {analysis['status_emoji']}")
+            print(f"Status: {analysis['status'].upper()}")
+            print(f"Meets Minimum ({analysis['requirements']['minimum']}%): {'✅' if analysis['meets_minimum'] else '❌'}")
+            print(f"Meets Target ({analysis['requirements']['target']}%): {'✅' if analysis['meets_target'] else '❌'}")
+            print(f"Meets Excellent ({analysis['requirements']['excellent']}%): {'✅' if analysis['meets_excellent'] else '❌'}")
+            
+            print(f"\n📁 File-by-File Analysis")
+            print(f"{'='*50}")
+            for file_path, data in analysis["file_analysis"].items():
+                status_emoji = "🎉" if data["status"] == "excellent" else "✅" if data["status"] == "good" else "⚠️" if data["status"] == "acceptable" else "❌"
+                print(f"{file_path}: {data['coverage']:.1f}% {status_emoji}")
+            
+            print(f"\n💡 Recommendations")
+            print(f"{'='*50}")
+            for i, rec in enumerate(recommendations, 1):
+                print(f"{i}. {rec}")
+            
+            print(f"\n🎯 Next Steps")
+            print(f"{'='*50}")
+            if analysis["meets_excellent"]:
+                print("1. Maintain current coverage levels")
+                print("2. Focus on test quality and maintainability")
+                print("3. Consider property-based testing")
+            elif analysis["meets_target"]:
+                print("1. Focus on edge cases and error handling")
+                print("2. Add integration tests for complex scenarios")
+                print("3. Improve test coverage for low-coverage files")
+            elif analysis["meets_minimum"]:
+                print("1. Increase coverage to reach target (80%)")
+                print("2. Add tests for critical functionality")
+                print("3. Focus on files with lowest coverage")
+            else:
+                print("1. Prioritize increasing coverage to meet minimum (70%)")
+                print("2. Add basic tests for all major functions")
+                print("3. Focus on critical paths and error handling")
+        sys.stdout.write(buf.getvalue())
 
 def main():
     if len(sys.argv) > 1: